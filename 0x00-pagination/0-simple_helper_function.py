@@ -2,9 +2,11 @@
 """
 index_range helper function
 """
+from functools import lru_cache
 from typing import Tuple
 
 
+@lru_cache(maxsize=256)
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
     """
     returns a tuple of size two containing start stop index corresponding
@@ -15,9 +17,5 @@ def index_range(page: int, page_size: int) -> Tuple[int, int]:
     Return:
         tuple
     """
-    start, end = 0, 0
-    for i in range(page):
-        start = end
-        end += page_size
-
-    return (start, end)
+    start = (page - 1) * page_size
+    return (start, start + page_size)
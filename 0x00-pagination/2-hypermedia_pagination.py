@@ -2,66 +2,52 @@
 """
 pagination documentation writing just because
 """
-import csv
-import math
-from typing import List
+import json
+from collections import OrderedDict
+from base_server import BaseServer, index_range
 
 
-def index_range(page: int, page_size: int) -> tuple:
-    """start and stop index for the database pagination"""
-    start_index = (page - 1) * page_size
-    end_index = page * page_size
-    return start_index, end_index
-
-
-class Server:
+class Server(BaseServer):
     """
     babyname database pagination
     """
-    DATA_FILE = "Popular_Baby_Names.csv"
+    __slots__ = ('__hyper_json',)
+    HYPER_JSON_MAX = 1024
 
     def __init__(self):
-        self.__dataset = None
-
-    def dataset(self) -> List[List]:
-        """Cached dataset
-        """
-        if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
-                reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
-
-        return self.__dataset
-
-    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
-        """
-        page instantiation
-        """
-        assert isinstance(page, int) and page > 0
-        assert isinstance(page_size, int) and page_size > 0
-
-        start_index, end_index = index_range(page, page_size)
-        dataset = self.dataset()
-
-        if start_index >= len(dataset):
-            return []
-
-        return dataset[start_index:end_index]
+        super().__init__()
+        self.__hyper_json = OrderedDict()
 
     def get_hyper(self, page: int = 1, page_size: int = 10) -> dict:
         """
         hyper getting to a dataset dictionary
         """
         page_data = self.get_page(page, page_size)
-        total_pages = math.ceil(len(self.dataset()) / page_size)
+        total = len(self.dataset())
+        total_pages = -(-total // page_size)
 
         return {
             'page_size': len(page_data),
             'page': page,
             'data': page_data,
-            'next_page': page + 1 if page * page_size < len(self.dataset())
-            else None,
+            'next_page': page + 1 if page * page_size < total else None,
             'prev_page': page - 1 if page > 1 else None,
             'total_pages': total_pages
         }
+
+    def get_hyper_json(self, page: int = 1, page_size: int = 10) -> str:
+        """
+        get_hyper serialized to json for a Flask view to return as the body,
+        keeping the HYPER_JSON_MAX most recently used pages
+        """
+        key = (page, page_size)
+        payload = self.__hyper_json.get(key)
+        if payload is not None:
+            self.__hyper_json.move_to_end(key)
+            return payload
+        payload = json.dumps(self.get_hyper(page, page_size),
+                             separators=(',', ':'))
+        self.__hyper_json[key] = payload
+        if len(self.__hyper_json) > self.HYPER_JSON_MAX:
+            self.__hyper_json.popitem(last=False)
+        return payload
@@ -2,51 +2,42 @@
 """
 del-pagination documentation
 """
-import csv
 from typing import List, Dict
+from base_server import BaseServer
 
 
-class Server:
+class Server(BaseServer):
     """server class documentation"""
-    DATA_FILE = "Popular_Baby_Names.csv"
+    __slots__ = ('__indexed_dataset',)
 
     def __init__(self):
-        self.__dataset = None
+        super().__init__()
         self.__indexed_dataset = None
 
-    def dataset(self) -> List[List]:
-        """ cache of the freakin dataset"""
-        if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
-                reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
-
-        return self.__dataset
-
     def indexed_dataset(self) -> Dict[int, List]:
         """
         sort dataset index starting at zero
         """
         if self.__indexed_dataset is None:
-            dataset = self.dataset()
-            truncated_dataset = dataset[:1000]
-            self.__indexed_dataset = {
-                i: dataset[i] for i in range(len(dataset))
-            }
+            self.__indexed_dataset = dict(enumerate(self.dataset()))
         return self.__indexed_dataset
 
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
         """
         hyper-index instatiation
         """
-        assert isinstance(index, int) and \
-            0 <= index < len(self.indexed_dataset())
+        indexed_data = self.indexed_dataset()
+        assert isinstance(index, int) and 0 <= index < len(indexed_data)
         assert isinstance(page_size, int) and page_size > 0
 
-        next_index = index + page_size
-        data = [self.indexed_dataset().get(i, [])
-                for i in range(index, next_index)]
+        n = len(self.dataset())
+        data = []
+        next_index = index
+        while len(data) < page_size and next_index < n:
+            row = indexed_data.get(next_index)
+            if row is not None:
+                data.append(row)
+            next_index += 1
 
         return {
             'index': index,
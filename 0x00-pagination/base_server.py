@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+BaseServer module
+"""
+import csv
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+index_range = __import__('0-simple_helper_function').index_range
+
+
+@lru_cache(maxsize=4)
+def _load_table(path: str) -> Tuple[List[str], List[List]]:
+    """
+    parse the csv once per path into its header and rows
+    """
+    with open(path, newline='', buffering=1 << 23) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        return header, list(reader)
+
+
+def _load(path: str) -> List[List]:
+    """
+    rows of the csv without the header row
+    """
+    return _load_table(path)[1]
+
+
+@lru_cache(maxsize=4)
+def _load_columns(path: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    column-major index of the csv, keyed by header name
+    """
+    header, rows = _load_table(path)
+    return dict(zip(header, zip(*rows)))
+
+
+class BaseServer:
+    """
+    babyname dataset shared by the pagination servers
+    """
+    __slots__ = ('__dataset',)
+    DATA_FILE = "Popular_Baby_Names.csv"
+
+    def __init__(self):
+        self.__dataset = None
+
+    def dataset(self) -> List[List]:
+        """ dataset of cache """
+        if self.__dataset is None:
+            self.__dataset = _load(self.DATA_FILE)
+
+        return self.__dataset
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+        """
+        page documentation
+        """
+        assert isinstance(page, int) and page > 0
+        assert isinstance(page_size, int) and page_size > 0
+
+        start_index, end_index = index_range(page, page_size)
+        dataset = self.dataset()
+
+        if start_index >= len(dataset):
+            return []
+
+        return dataset[start_index:end_index]
+
+    def columns(self) -> Dict[str, Tuple[str, ...]]:
+        """ extra column by column index of the dataset """
+        return _load_columns(self.DATA_FILE)
+
+    def get_page_columns(self, cols: List[str], page: int = 1,
+                         page_size: int = 10) -> List[Tuple]:
+        """
+        page of only the requested columns, one tuple per row
+        """
+        assert isinstance(page, int) and page > 0
+        assert isinstance(page_size, int) and page_size > 0
+
+        start_index, end_index = index_range(page, page_size)
+        columns = self.columns()
+        return list(zip(*(columns[c][start_index:end_index]
+                          for c in cols)))
+
+
+try:
+    _load(BaseServer.DATA_FILE)
+except OSError:
+    pass
@@ -9,6 +9,7 @@ class BasicCache(BaseCaching):
     """
     caching information in key-value
     """
+    __slots__ = ()
 
     def __init__(self):
         """
@@ -21,14 +22,13 @@ class BasicCache(BaseCaching):
         assign to the dictionary
         """
         if key is None or item is None:
-            pass
-        else:
-            self.cache_data[key] = item
+            return
+        self.cache_data[key] = item
 
     def get(self, key):
         """
         value linked to the key/nothing
         """
-        if key is not None and key in self.cache_data.keys():
-            return self.cache_data[key]
-        return None
+        if key is None:
+            return None
+        return self.cache_data.get(key)
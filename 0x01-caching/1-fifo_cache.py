@@ -2,6 +2,7 @@
 """
 FIFO caching
 """
+from collections import OrderedDict
 from base_caching import BaseCaching
 
 
@@ -9,33 +10,32 @@ class FIFOCache(BaseCaching):
     """
     fifo class cache thing
     """
+    __slots__ = ()
 
     def __init__(self):
         """
         parent class init
         """
         super().__init__()
-        self.order = []
+        self.cache_data = OrderedDict()
 
     def put(self, key, item):
         """
         k-v cache upload
         """
         if key is None or item is None:
-            pass
-        else:
-            length = len(self.cache_data)
-            if length >= BaseCaching.MAX_ITEMS and key not in self.cache_data:
-                print("DISCARD: {}".format(self.order[0]))
-                del self.cache_data[self.order[0]]
-                del self.order[0]
-            self.order.append(key)
-            self.cache_data[key] = item
+            return
+        length = len(self.cache_data)
+        if length >= BaseCaching.MAX_ITEMS and key not in self.cache_data:
+            oldest, _ = self.cache_data.popitem(last=False)
+            if __debug__:
+                print("DISCARD: {}".format(oldest))
+        self.cache_data[key] = item
 
     def get(self, key):
         """
         linked key value/nothing
         """
-        if key is not None and key in self.cache_data.keys():
-            return self.cache_data[key]
-        return None
+        if key is None:
+            return None
+        return self.cache_data.get(key)
@@ -41,7 +41,8 @@ class LFUCache(BaseCaching):
                 else:
                     discard = lfu_keys[0]
 
-                print("DISCARD: {}".format(discard))
+                if __debug__:
+                    print("DISCARD: {}".format(discard))
                 del self.cache_data[discard]
                 del self.usage[self.usage.index(discard)]
                 del self.frequency[discard]
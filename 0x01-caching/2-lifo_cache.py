@@ -26,7 +26,8 @@ class LIFOCache(BaseCaching):
         else:
             length = len(self.cache_data)
             if length >= BaseCaching.MAX_ITEMS and key not in self.cache_data:
-                print("DISCARD: {}".format(self.order[-1]))
+                if __debug__:
+                    print("DISCARD: {}".format(self.order[-1]))
                 del self.cache_data[self.order[-1]]
                 del self.order[-1]
 
@@ -25,7 +25,8 @@ class LRUCache(BaseCaching):
         else:
             length = len(self.cache_data)
             if length >= BaseCaching.MAX_ITEMS and key not in self.cache_data:
-                print("DISCARD: {}".format(self.usage[0]))
+                if __debug__:
+                    print("DISCARD: {}".format(self.usage[0]))
                 del self.cache_data[self.usage[0]]
                 del self.usage[0]
             if key in self.usage:
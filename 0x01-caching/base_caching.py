@@ -7,6 +7,7 @@ class BaseCaching():
       - constants of your caching system
       - where your data are stored (in a dictionary)
     """
+    __slots__ = ('cache_data',)
     MAX_ITEMS = 4
 
     def __init__(self):
@@ -3,16 +3,21 @@
 flask api
 """
 from flask import Flask
+from flask import Response
 from flask import render_template
 
 
 app = Flask(__name__)
 
+with app.app_context():
+    _rendered = render_template('0-index.html')
 
-@app.route('/', strict_slashes=False)
+
+@app.route('/', strict_slashes=False, methods=['GET'],
+           provide_automatic_options=False)
 def index():
-    """html page output"""
-    return render_template('0-index.html')
+    """html page output, rendered once at startup"""
+    return Response(_rendered, mimetype='text/html')
 
 
 if __name__ == '__main__':
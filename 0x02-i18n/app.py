@@ -6,7 +6,10 @@ Flask application demonstrating internationalization (i18n) and localization (l1
 - Employs Flask-Babel for language and timezone handling.
 """
 
+import datetime
 from typing import Dict, Union
+
+import pytz
 from flask import Flask, g, request, render_template
 from flask_babel import Babel, format_datetime
 
@@ -16,6 +19,9 @@ class Config:
     BABEL_DEFAULT_LOCALE = 'en'
     BABEL_DEFAULT_TIMEZONE = 'UTC'
 
+
+_LANGUAGES = frozenset(Config.LANGUAGES)
+
 app = Flask(__name__)
 app.config.from_object(Config)
 babel = Babel(app)
@@ -33,36 +39,60 @@ def get_user(user_id: int) -> Union[Dict, None]:
     return users.get(user_id)
 
 
+def resolve_locale() -> str:
+    """Determines the user's preferred locale based on various sources."""
+    # User-specified locale from URL query string
+    locale = request.args.get('locale')
+    if locale in _LANGUAGES:
+        return locale
+    # User's locale preference (if logged in)
+    if g.user:
+        locale = g.user.get('locale')
+        if locale in _LANGUAGES:
+            return locale
+    # Browser's preferred language
+    locale = request.accept_languages.best_match(app.config['LANGUAGES'])
+    if locale:
+        return locale
+    return Config.BABEL_DEFAULT_LOCALE  # Default application locale
+
+
+def resolve_timezone() -> str:
+    """Determines the user's preferred timezone based on various sources."""
+    # User-specified timezone, then the logged in user's timezone
+    user_tz = request.args.get('timezone')
+    if not user_tz and g.user:
+        user_tz = g.user.get('timezone')
+    try:
+        # Validate and return valid timezone
+        return pytz.timezone(user_tz).zone
+    except (AttributeError, pytz.exceptions.UnknownTimeZoneError):
+        return app.config['BABEL_DEFAULT_TIMEZONE']  # Use default timezone
+
+
 @babel.localeselector
 def get_locale():
-    """Determines the user's preferred locale based on various sources."""
-    options = [
-        request.args.get('locale'),  # User-specified locale from URL query string
-        g.user.get('locale') if g.user else None,  # User's locale preference (if logged in)
-        request.accept_languages.best_match(app.config['LANGUAGES']),  # Browser's preferred language
-        Config.BABEL_DEFAULT_LOCALE,  # Default application locale
-    ]
-    return next((o for o in options if o and o in Config.LANGUAGES), None)
+    """Returns the locale resolved once for the current request."""
+    return g.get('locale')
 
 
 @babel.timezoneselector
 def get_timezone():
-    """Determines the user's preferred timezone based on various sources."""
-    user_tz = request.args.get('timezone') or g.user.get('timezone')  # User-specified timezone
-    try:
-        return pytz.timezone(user_tz).zone  # Validate and return valid timezone
-    except pytz.exceptions.UnknownTimeZoneError:
-        return app.config['BABEL_DEFAULT_TIMEZONE']  # Use default timezone
+    """Returns the timezone resolved once for the current request."""
+    return g.get('timezone')
 
 
 @app.before_request
 def before_request():
-    """Populates global context with user and current time information before each request."""
-    g.user = get_user(request.args.get('login_as', 0))  # Retrieve user based on login ID
+    """Populates global context with user, locale, timezone and time."""
+    # Retrieve user based on login ID
+    g.user = get_user(request.args.get('login_as', 0))
+    g.locale = resolve_locale()  # Resolve locale once per request
+    g.timezone = resolve_timezone()  # Resolve timezone once per request
     g.time = format_datetime(datetime.datetime.now())  # Store current time
 
 
-@app.route('/')
+@app.route('/', methods=['GET'], provide_automatic_options=False)
 def index():
     """Renders the main application template."""
     return render_template('index.html')
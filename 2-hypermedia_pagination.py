@@ -14,56 +14,25 @@ methods to:
     - total number of pages
     - data for the requested page
     - links to previous and next pages (if applicable)
+
+Requires the 0x00-pagination directory on the import path (e.g.
+`PYTHONPATH=0x00-pagination`), since `Server` is built on `base_server`.
 """
 
-import csv
 from typing import List
 
-# Import the index_range function from another module (assumed to be in the same directory)
-index_range = __import__('0-simple_helper_function').index_range
+from base_server import BaseServer, index_range
 
 
-class Server:
+class Server(BaseServer):
     """
     Server class for paginating a database of popular baby names stored in a CSV file.
 
     This class provides functionalities for managing and retrieving paginated baby
-    names data.
+    names data. Loading, caching and page slicing are inherited from `BaseServer`.
     """
 
-    DATA_FILE = "Popular_Baby_Names.csv"
-
-    def __init__(self):
-        """
-        Initializes the server object.
-
-        This constructor doesn't take any arguments. It initializes an internal
-        attribute (`self.__dataset`) to store the loaded baby names data as a list
-        of lists (where each inner list represents a single baby name entry).
-        The data is initially set to `None`.
-        """
-        self.__dataset = None
-
-    def dataset(self) -> List[List]:
-        """
-        Loads the baby names data from the CSV file and returns it as a list of lists.
-
-        This method retrieves the baby names data from the specified CSV file
-        stored in the `DATA_FILE` attribute. It uses a cache (`self.__dataset`) to
-        avoid re-reading the file on every call.
-
-        Returns:
-            List[List]: The baby names data loaded from the CSV file.
-        """
-        if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
-                reader = csv.reader(f)
-                # Skip the header row (assuming the first row contains headers)
-                next(reader)
-                dataset = [row for row in reader]
-            self.__dataset = dataset
-
-        return self.__dataset
+    __slots__ = ()
 
     @staticmethod
     def assert_positive_integer_type(value: int) -> None:
@@ -82,10 +51,9 @@ class Server:
         """
         Retrieves a specific page of baby names data based on page number and page size.
 
-        This method takes the desired page number (defaulting to 1) and the number of
-        items per page (defaulting to 10) as arguments. It validates the arguments
-        and retrieves the corresponding data from the loaded baby names dataset. If
-        the requested page is beyond the available data, an empty list is returned.
+        The arguments are validated with `assert_positive_integer_type`, so only
+        real positive integers (not bools) are accepted, before the page is
+        sliced by `BaseServer.get_page`.
 
         Args:
             page (int, optional): The page number to retrieve (default: 1).
@@ -97,13 +65,7 @@ class Server:
         """
         self.assert_positive_integer_type(page)
         self.assert_positive_integer_type(page_size)
-        dataset = self.dataset()
-        start, end = index_range(page, page_size)
-        try:
-            # Return the data slice for the requested page
-            return dataset[start:end]
-        except IndexError:
-            return []
+        return super().get_page(page, page_size)
 
     def get_hyper(self, page: int = 1, page_size: int = 10) -> dict:
         """